@@ -3,6 +3,7 @@ from cudaq import spin
 
 from typing import List
 
+import functools
 import numpy as np
 
 # Here we build up a kernel for QAOA with `p` layers, with each layer
@@ -26,43 +27,84 @@ hamiltonian = 0.5 * spin.z(0) * spin.z(1) + 0.5 * spin.z(1) * spin.z(2) \
 qubit_count: int = 4
 layer_count: int = 2
 parameter_count: int = 2 * layer_count
+# Each edge `(qubit, (qubit + 1) % qubit_count)` of the ring as a Pauli word
+# with `Z` on the two vertices, e.g. `ZZII` for the edge `(v0, v1)`.
+edges: List[str] = []
+for qubit in range(qubit_count):
+    word = ['I'] * qubit_count
+    word[qubit] = word[(qubit + 1) % qubit_count] = 'Z'
+    edges.append(''.join(word))
 
 
-@cudaq.kernel
-def kernel_qaoa(qubit_count: int, layer_count: int, thetas: List[float]):
-    """QAOA ansatz for Max-Cut"""
-    qvector = cudaq.qvector(qubit_count)
+# The qubit and layer counts are fixed for the whole optimization, so build
+# the kernel with them captured as compile-time constants rather than passing
+# them as runtime arguments. Kernels are cached per problem size.
+@functools.lru_cache(maxsize=None)
+def make_kernel_qaoa(qubit_count: int, layer_count: int):
 
-    # Create superposition
-    h(qvector)
+    @cudaq.kernel
+    def kernel_qaoa(thetas: List[float], edges: List[cudaq.pauli_word]):
+        """QAOA ansatz for Max-Cut"""
+        qvector = cudaq.qvector(qubit_count)
 
-    # Loop over the layers
-    for layer in range(layer_count):
-        # Loop over the qubits
-        # Problem unitary
-        for qubit in range(qubit_count):
-            x.ctrl(qvector[qubit], qvector[(qubit + 1) % qubit_count])
-            rz(2.0 * thetas[layer], qvector[(qubit + 1) % qubit_count])
-            x.ctrl(qvector[qubit], qvector[(qubit + 1) % qubit_count])
+        # Create superposition
+        h(qvector)
 
-        # Mixer unitary
-        for qubit in range(qubit_count):
-            rx(2.0 * thetas[layer + layer_count], qvector[qubit])
+        # Loop over the layers
+        for layer in range(layer_count):
+            # The problem and mixer angles are the same for every gate
+            # within a layer, compute them once.
+            gamma = -thetas[layer]
+            beta = 2.0 * thetas[layer + layer_count]
 
+            # Loop over the edges
+            # Problem unitary, exp(-i theta Z_j Z_k) applied as a single
+            # Pauli rotation rather than a CNOT-Rz-CNOT sequence
+            for edge in edges:
+                exp_pauli(gamma, qvector, edge)
+
+            # Mixer unitary, applied to all qubits with the same angle
+            rx(beta, qvector)
+
+    return kernel_qaoa
+
+
+kernel_qaoa = make_kernel_qaoa(qubit_count, layer_count)
 
 # Specify the optimizer and its initial parameters. Make it repeatable.
 cudaq.set_random_seed(13)
-optimizer = cudaq.optimizers.COBYLA()
-np.random.seed(13)
-optimizer.initial_parameters = np.random.uniform(-np.pi / 8.0, np.pi / 8.0,
-                                                 parameter_count)
+optimizer = cudaq.optimizers.LBFGS()
+rng = np.random.default_rng(13)
+optimizer.initial_parameters = rng.uniform(-np.pi / 8.0, np.pi / 8.0,
+                                           parameter_count)
 print("Initial parameters = ", optimizer.initial_parameters)
 
+# The objective is smooth in the parameters, so a gradient-based optimizer
+# converges in far fewer expectation value evaluations than a derivative-free
+# one. The gradient is computed with central differences. The step is kept
+# large enough that the rounding error of a single precision simulator, the
+# default on GPUs, does not swamp the difference.
+gradient_step = 1e-2
+
+
+def expectation(parameters):
+    return cudaq.observe(kernel_qaoa, hamiltonian, parameters.tolist(),
+                         edges).expectation()
+
 
-# Define the objective, return `<state(params) | H | state(params)>`
+# Define the objective, return `<state(params) | H | state(params)>` along
+# with its gradient vector
 def objective(parameters):
-    return cudaq.observe(kernel_qaoa, hamiltonian, qubit_count, layer_count,
-                         parameters).expectation()
+    parameters = np.asarray(parameters)
+    cost = expectation(parameters)
+    gradient = []
+    for i in range(parameter_count):
+        shift = np.zeros(parameter_count)
+        shift[i] = gradient_step
+        gradient.append(
+            (expectation(parameters + shift) - expectation(parameters - shift))
+            / (2.0 * gradient_step))
+    return cost, gradient
 
 
 # Optimize!
@@ -74,5 +116,5 @@ print("Optimal value = ", optimal_expectation)
 print("Optimal parameters = ", optimal_parameters)
 
 # Sample the circuit using the optimized parameters
-counts = cudaq.sample(kernel_qaoa, qubit_count, layer_count, optimal_parameters)
+counts = cudaq.sample(kernel_qaoa, optimal_parameters, edges)
 print(counts)
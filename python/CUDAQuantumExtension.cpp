@@ -34,6 +34,7 @@
 #include "mlir/Target/LLVMIR/Dialect/LLVMIR/LLVMToLLVMIRTranslation.h"
 
 #include <pybind11/complex.h>
+#include <pybind11/numpy.h>
 #include <pybind11/pytypes.h>
 #include <pybind11/stl.h>
 
@@ -124,6 +125,22 @@ PYBIND11_MODULE(_quakeDialects, m) {
   mpiSubmodule.def(
       "num_ranks", []() { return cudaq::mpi::num_ranks(); },
       "Return the total number of ranks.");
+  mpiSubmodule.def(
+      "all_gather",
+      [](std::size_t globalVectorSize,
+         py::array_t<double, py::array::c_style> local) {
+        // Copy the contiguous buffer directly rather than converting it
+        // element by element through the list overload.
+        std::vector<double> localData(local.data(),
+                                      local.data() + local.size());
+        std::vector<double> global(globalVectorSize);
+        cudaq::mpi::all_gather(global, localData);
+        return py::array_t<double>(global.size(), global.data());
+      },
+      py::arg("globalVectorSize"), py::arg("local").noconvert(),
+      "Gather and scatter the `local` array of floating-point numbers, "
+      "returning a concatenation of all arrays across all ranks as a "
+      "`numpy.ndarray`. The total global array size must be provided.");
   mpiSubmodule.def(
       "all_gather",
       [](std::size_t globalVectorSize, std::vector<double> &local) {
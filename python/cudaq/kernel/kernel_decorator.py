@@ -129,6 +129,11 @@ class PyKernelDecorator(object):
         if the kernel is already compiled. 
         """
 
+        # If we are compiled and captured nothing from the
+        # parent frame, there is nothing that could have changed.
+        if self.module != None and not self.dependentCaptures:
+            return
+
         # Before we can execute, we need to make sure
         # variables from the parent frame that we captured
         # have not changed. If they have changed, we need to
@@ -139,10 +144,7 @@ class PyKernelDecorator(object):
                 # We found the parent frame, now
                 # see if any of the variables we depend
                 # on have changed.
-                self.globalScopedVars = {
-                    k: v
-                    for k, v in dict(inspect.getmembers(s))['f_locals'].items()
-                }
+                self.globalScopedVars = dict(s.f_locals)
                 if self.dependentCaptures != None:
                     for k, v in self.dependentCaptures.items():
                         if self.globalScopedVars[k] != v:
@@ -99,6 +99,9 @@ def __isBroadcast(kernel, *args):
 
 def __createArgumentSet(*args):
     nArgSets = len(args[0])
+    # Convert any `ndarray` arguments to lists once, rather than
+    # once per argument set.
+    args = [arg.tolist() if hasattr(arg, "tolist") else arg for arg in args]
     argSet = []
     for j in range(nArgSets):
         currentArgs = [0 for i in range(len(args))]
@@ -107,12 +110,5 @@ def __createArgumentSet(*args):
             if isinstance(arg, list) or isinstance(arg, List):
                 currentArgs[i] = arg[j]
 
-            if hasattr(arg, "tolist"):
-                shape = arg.shape
-                if len(shape) == 2:
-                    currentArgs[i] = arg[j].tolist()
-                else:
-                    currentArgs[i] = arg.tolist()[j]
-
         argSet.append(tuple(currentArgs))
     return argSet
@@ -29,10 +29,39 @@ void extractStateData(py::buffer_info &info, complex *data) {
   if (info.ndim > 2)
     throw std::runtime_error("Incompatible buffer shape.");
 
-  std::size_t size = info.shape[0];
-  if (info.shape.size() == 2)
-    size *= info.shape[1];
-  memcpy(data, info.ptr, sizeof(complex) * (size));
+  // The state data is stored in row-major order. A row-major contiguous
+  // buffer can be copied in one go, anything else (e.g. a column-major or
+  // sliced array) has to be gathered element by element.
+  const py::ssize_t itemSize = sizeof(complex);
+  std::size_t rows = info.shape[0];
+  std::size_t cols = info.ndim == 2 ? info.shape[1] : 1;
+  py::ssize_t rowStride = info.strides[0];
+  py::ssize_t colStride = info.ndim == 2 ? info.strides[1] : itemSize;
+  bool isContiguous =
+      (rows <= 1 || rowStride == static_cast<py::ssize_t>(cols) * itemSize) &&
+      (cols <= 1 || colStride == itemSize);
+  if (isContiguous) {
+    memcpy(data, info.ptr, sizeof(complex) * rows * cols);
+    return;
+  }
+
+  auto *ptr = static_cast<const char *>(info.ptr);
+  for (std::size_t i = 0; i < rows; i++)
+    for (std::size_t j = 0; j < cols; j++)
+      data[i * cols + j] = *reinterpret_cast<const complex *>(
+          ptr + static_cast<py::ssize_t>(i) * rowStride +
+          static_cast<py::ssize_t>(j) * colStride);
+}
+
+/// @brief Create a state from the provided buffer, copying its data only once.
+state createStateFromBuffer(py::buffer_info &info) {
+  std::vector<std::size_t> shape(info.shape.begin(), info.shape.end());
+  std::size_t size = shape[0];
+  if (shape.size() == 2)
+    size *= shape[1];
+  std::vector<complex> v(size);
+  extractStateData(info, v.data());
+  return state(std::make_tuple(std::move(shape), std::move(v)));
 }
 
 /// @brief Run `cudaq::get_state` on the provided kernel and spin operator.
@@ -81,16 +110,7 @@ void bindPyState(py::module &mod) {
       })
       .def(py::init([](const py::buffer &b) {
              py::buffer_info info = b.request();
-             std::vector<std::size_t> shape;
-             for (auto s : info.shape)
-               shape.push_back(s);
-             std::size_t size = shape[0];
-             if (shape.size() == 2)
-               size *= shape[1];
-             std::vector<complex> v(size);
-             extractStateData(info, v.data());
-             auto t = std::make_tuple(shape, v);
-             return state(t);
+             return createStateFromBuffer(info);
            }),
            R"#(Construct the :class:`State` from an existing array of data.
 
@@ -165,16 +185,7 @@ index pair.
           "overlap",
           [](state &self, py::buffer &other) {
             py::buffer_info info = other.request();
-            std::vector<std::size_t> shape;
-            for (auto s : info.shape)
-              shape.push_back(s);
-            std::size_t size = shape[0];
-            if (shape.size() == 2)
-              size *= shape[1];
-            std::vector<complex> v(size);
-            extractStateData(info, v.data());
-            auto t = std::make_tuple(shape, v);
-            state ss(t);
+            auto ss = createStateFromBuffer(info);
             return self.overlap(ss);
           },
           "Compute the overlap between the provided :class:`State`'s.");
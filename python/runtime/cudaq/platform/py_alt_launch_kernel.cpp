@@ -43,8 +43,6 @@ jitAndCreateArgs(const std::string &name, MlirModule module,
                  const std::vector<std::string> &names, Type returnType) {
   ScopedTraceWithContext(cudaq::TIMING_JIT, "jitAndCreateArgs", name);
   auto mod = unwrap(module);
-  auto cloned = mod.clone();
-  auto context = cloned.getContext();
 
   // Have we JIT compiled this before?
   auto hash = llvm::hash_code{0};
@@ -60,6 +58,9 @@ jitAndCreateArgs(const std::string &name, MlirModule module,
     ScopedTraceWithContext(cudaq::TIMING_JIT,
                            "jitAndCreateArgs - execute passes", name);
 
+    // Only clone the module when we actually need to lower it.
+    auto cloned = mod.clone();
+    auto context = cloned.getContext();
     PassManager pm(context);
     pm.addNestedPass<func::FuncOp>(
         cudaq::opt::createPySynthCallableBlockArgs(names));
@@ -59,7 +59,6 @@ def test_OQC_sample():
     # FIXME CANT HAVE LOOP IN IT YET...
     kernel.mz(qubits[0])
     kernel.mz(qubits[1])
-    print(kernel)
 
     # Run sample synchronously, this is fine
     # here in testing since we are targeting a mock
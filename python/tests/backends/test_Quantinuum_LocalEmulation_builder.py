@@ -42,7 +42,6 @@ def test_quantinuum_sample():
     kernel.h(qubits[0])
     kernel.cx(qubits[0], qubits[1])
     kernel.mz(qubits)
-    print(kernel)
 
     # Run sample synchronously, this is fine
     # here in testing since we are targeting a mock
@@ -95,7 +94,6 @@ def test_quantinuum_exp_pauli():
     qreg = kernel.qalloc(2)
     kernel.x(qreg[0])
     kernel.exp_pauli(theta, qreg, "XY")
-    print(kernel)
     # Define its spin Hamiltonian.
     hamiltonian = 5.907 - 2.1433 * spin.x(0) * spin.x(1) - 2.1433 * spin.y(
         0) * spin.y(1) + .21829 * spin.z(0) - 6.125 * spin.z(1)
@@ -44,7 +44,6 @@ def test_quantinuum_sample():
         x.ctrl(qubits[0], qubits[1])
         mz(qubits)
 
-    print(simple)
     # Run sample synchronously, this is fine
     # here in testing since we are targeting a mock
     # server. In reality you'd probably not want to
@@ -67,7 +67,6 @@ def test_quantinuum_sample():
     kernel.h(qubits[0])
     kernel.cx(qubits[0], qubits[1])
     kernel.mz(qubits)
-    print(kernel)
 
     # Run sample synchronously, this is fine
     # here in testing since we are targeting a mock
@@ -6,7 +6,7 @@
 # the terms of the Apache License 2.0 which accompanies this distribution.     #
 # ============================================================================ #
 
-import cudaq, pytest, os, time
+import cudaq, pytest, os, time, socket
 from cudaq import spin
 from multiprocessing import Process
 try:
@@ -18,11 +18,34 @@ except:
 # Define the port for the mock server
 port = 62440
 
+# Spin Hamiltonian used by the observe tests, built once per session.
+hamiltonian = 5.907 - 2.1433 * spin.x(0) * spin.x(1) - 2.1433 * spin.y(
+    0) * spin.y(1) + .21829 * spin.z(0) - 6.125 * spin.z(1)
+
 
 def assert_close(got) -> bool:
     return got < -1.5 and got > -1.9
 
 
+def waitForServer(process, port, timeout=10.):
+    """Block until the mock server `process` accepts connections on `port`."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if not process.is_alive():
+            raise RuntimeError(
+                f"Mock server exited with code {process.exitcode}.")
+        try:
+            socket.create_connection(('localhost', port), timeout=.1).close()
+        except OSError:
+            time.sleep(.01)
+            continue
+        # Make sure it is our server that answered, and not a stale
+        # listener left on the port while ours failed to start.
+        if process.is_alive():
+            return
+    raise RuntimeError(f"Mock server did not start on port {port}.")
+
+
 @pytest.fixture(scope="session", autouse=True)
 def startUpMockServer():
     # We need a Fake Credentials Config file
@@ -36,15 +59,17 @@ def startUpMockServer():
     # Set the targeted QPU
     cudaq.set_target('quantinuum', url='http://localhost:{}'.format(port))
 
-    # Launch the Mock Server
+    # Launch the Mock Server. It runs the simulation with its own CUDA-Q
+    # runtime, so it must live in a separate process from the client.
     p = Process(target=startServer, args=(port,))
     p.start()
-    time.sleep(1)
+    waitForServer(p, port)
 
     yield credsName
 
     # Kill the server, remove the file
     p.terminate()
+    p.join()
     os.remove(credsName)
 
 
@@ -69,8 +94,6 @@ def test_quantinuum_sample():
         x.ctrl(qubits[0], qubits[1])
         mz(qubits)
 
-    print(simple)
-
     # Run sample synchronously, this is fine
     # here in testing since we are targeting a mock
     # server. In reality you'd probably not want to
@@ -95,7 +118,6 @@ def test_quantinuum_sample():
     # job asynchronously, this puts it in the queue, now
     # you can take the future and persist it to file for later.
     future = cudaq.sample_async(simple)
-    print(future)
 
     # Persist the future to a file (or here a string,
     # could write this string to file for later)
@@ -120,10 +142,6 @@ def test_quantinuum_observe():
         ry(theta, qreg[1])
         x.ctrl(qreg[1], qreg[0])
 
-    # Define its spin Hamiltonian.
-    hamiltonian = 5.907 - 2.1433 * spin.x(0) * spin.x(1) - 2.1433 * spin.y(
-        0) * spin.y(1) + .21829 * spin.z(0) - 6.125 * spin.z(1)
-
     # Run the observe task on quantinuum synchronously
     res = cudaq.observe(ansatz, hamiltonian, .59)
     assert assert_close(res.expectation())
@@ -137,7 +155,6 @@ def test_quantinuum_observe():
     # Launch the job async, job goes in the queue, and
     # we're free to dump the future to file
     future = cudaq.observe_async(ansatz, hamiltonian, .59)
-    print(future)
     futureAsString = str(future)
 
     # Later you can come back and read it in
@@ -34,9 +34,6 @@ def test_state_buffer_vector(want_vector):
     got_state_a = cudaq.State(want_vector)
     got_state_b = cudaq.State(want_vector)
 
-    print("got_state_a = ", got_state_a)
-    print("got_state_b = ", got_state_b)
-
     # Check all of the `overlap` overloads.
     assert np.isclose(got_state_a.overlap(want_vector), 1.0)
     assert np.isclose(got_state_b.overlap(want_vector), 1.0)
@@ -46,20 +43,8 @@ def test_state_buffer_vector(want_vector):
     got_vector_a = np.array(got_state_a, copy=False)
     got_vector_b = np.array(got_state_b, copy=False)
 
-    print(f"want_vector = {want_vector}\n")
-    print(f"got_vector_a = {got_vector_a}\n")
-    print(f"got_vector_b = {got_vector_b}\n")
-    for i in range(len(got_vector_a)):
-        a_same = np.isclose(want_vector[i], got_vector_a[i])
-        b_same = np.isclose(want_vector[i], got_vector_b[i])
-        print(f"{i}-th element. Passes? {a_same and b_same}:\n")
-        print(f"want = {want_vector[i]}")
-        print(f"got_a = {got_vector_a[i]}")
-        print(f"got_b = {got_vector_b[i]}\n")
-        assert a_same
-        assert b_same
-    # assert np.allclose(want_vector, got_vector_a)
-    # assert np.allclose(want_vector, got_vector_b)
+    assert np.allclose(want_vector, got_vector_a)
+    assert np.allclose(want_vector, got_vector_b)
 
 
 @pytest.mark.parametrize("want_matrix", [
@@ -96,6 +81,23 @@ def test_state_buffer_density_matrix(want_matrix):
     assert np.allclose(want_matrix, got_matrix_b)
 
 
+def test_state_buffer_non_contiguous():
+    """
+    Tests that a :class:`State` built from a non row-major contiguous
+    array holds the same data as one built from a contiguous copy.
+    """
+    want_matrix = np.array([[0.5, 0.0, 0.0, 0.5j], [0.0, 0.0, 0.0, 0.0],
+                            [0.0, 0.0, 0.0, 0.0], [-0.5j, 0.0, 0.0, 0.5]],
+                           dtype=np.complex128)
+    got_state = cudaq.State(np.asfortranarray(want_matrix))
+    assert np.allclose(want_matrix, np.array(got_state, copy=False))
+
+    want_vector = np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0],
+                           dtype=np.complex128) / np.sqrt(2)
+    got_state = cudaq.State(want_vector[::2])
+    assert np.allclose(want_vector[::2], np.array(got_state, copy=False))
+
+
 def test_state_vector_simple():
     """
     A simple end-to-end test of the state class on a state vector
@@ -122,12 +124,7 @@ def test_state_vector_simple():
 
     # Check the entire vector with numpy.
     got_vector = np.array(got_state, copy=False)
-    for i in range(len(want_state)):
-        assert np.isclose(want_state[i], got_vector[i])
-        # if not np.isclose(got_vector[i], got_vector_b[i]):
-        print(f"want = {want_state[i]}")
-        print(f"got = {got_vector[i]}")
-    assert np.allclose(want_state, np.array(got_state))
+    assert np.allclose(want_state, got_vector)
 
     # Check overlaps.
     want_state_object = cudaq.State(want_state)
@@ -176,7 +173,6 @@ def test_state_vector_integration():
 
     # Check the state from the kernel at the fixed parameters.
     bell_state = cudaq.get_state(kernel, optimal_parameters)
-    print(bell_state)
     assert np.allclose(want_state, bell_state, atol=1e-3)
 
 
@@ -195,7 +191,6 @@ def test_state_density_matrix_simple():
     kernel.cx(qubits[0], qubits[1])
 
     got_state = cudaq.get_state(kernel)
-    print(got_state)
 
     want_state = np.array([[0.5, 0.0, 0.0, 0.5], [0.0, 0.0, 0.0, 0.0],
                            [0.0, 0.0, 0.0, 0.0], [0.5, 0.0, 0.0, 0.5]],
@@ -268,7 +263,7 @@ def test_state_density_matrix_integration():
     cudaq.reset_target()
 
 
-def test_state_vector_async():
+def test_state_vector_async(request):
     """Tests `cudaq.get_state_async` on a simple kernel."""
 
     kernel, theta, phi = cudaq.make_kernel(float, float)
@@ -284,7 +279,8 @@ def test_state_vector_async():
     want_state = np.array([-1j / np.sqrt(2.), 0., 0., -1j / np.sqrt(2.)],
                           dtype=np.complex128)
     state = future.get()
-    state.dump()
+    if request.config.getoption("verbose") > 0:
+        state.dump()
     assert np.allclose(state, want_state, atol=1e-3)
     # Check invalid qpu_id
     with pytest.raises(Exception) as error:
@@ -54,12 +54,7 @@ def test_state_vector_simple():
 
     # Check the entire vector with numpy.
     got_vector = np.array(got_state, copy=False)
-    for i in range(len(want_state)):
-        assert np.isclose(want_state[i], got_vector[i])
-        # if not np.isclose(got_vector[i], got_vector_b[i]):
-        print(f"want = {want_state[i]}")
-        print(f"got = {got_vector[i]}")
-    assert np.allclose(want_state, np.array(got_state))
+    assert np.allclose(want_state, got_vector)
 
 
 def check_state_vector_integration(entity):
@@ -81,7 +76,6 @@ def check_state_vector_integration(entity):
 
     # Check the state from the kernel at the fixed parameters.
     bell_state = cudaq.get_state(entity, optimal_parameters)
-    print(bell_state)
     assert np.allclose(want_state, bell_state, atol=1e-3)
 
 
@@ -146,7 +140,6 @@ def test_state_density_matrix_simple():
         x.ctrl(qubits[0], qubits[1])
 
     got_state = cudaq.get_state(bell)
-    print(got_state)
 
     want_state = np.array([[0.5, 0.0, 0.0, 0.5], [0.0, 0.0, 0.0, 0.0],
                            [0.0, 0.0, 0.0, 0.0], [0.5, 0.0, 0.0, 0.5]],
@@ -165,7 +158,7 @@ def test_state_density_matrix_simple():
     cudaq.reset_target()
 
 
-def test_state_vector_async():
+def test_state_vector_async(request):
     """Tests `cudaq.get_state_async` on a simple kernel."""
 
     @cudaq.kernel
@@ -182,7 +175,8 @@ def test_state_vector_async():
     want_state = np.array([-1j / np.sqrt(2.), 0., 0., -1j / np.sqrt(2.)],
                           dtype=np.complex128)
     state = future.get()
-    state.dump()
+    if request.config.getoption("verbose") > 0:
+        state.dump()
     assert np.allclose(state, want_state, atol=1e-3)
     # Check invalid qpu_id
     with pytest.raises(Exception) as error:
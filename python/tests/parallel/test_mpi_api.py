@@ -32,15 +32,26 @@ def testMPI():
     localData = [cudaq.mpi.rank()]
     gatherData = cudaq.mpi.all_gather(cudaq.mpi.num_ranks(), localData)
     assert len(gatherData) == cudaq.mpi.num_ranks()
-    for idx, x in enumerate(gatherData):
-        assert x == idx
+    assert np.array_equal(gatherData, np.arange(cudaq.mpi.num_ranks()))
 
     # all_gather floats
     localData = [float(cudaq.mpi.rank())]
     gatherData = cudaq.mpi.all_gather(cudaq.mpi.num_ranks(), localData)
     assert len(gatherData) == cudaq.mpi.num_ranks()
-    for idx, x in enumerate(gatherData):
-        assert abs(gatherData[idx] - float(idx)) < 1e-12
+    assert np.allclose(gatherData,
+                       np.arange(cudaq.mpi.num_ranks(), dtype=np.float64),
+                       rtol=0.,
+                       atol=1e-12)
+
+    # all_gather a float64 numpy array
+    localData = np.array([cudaq.mpi.rank()], dtype=np.float64)
+    gatherData = cudaq.mpi.all_gather(cudaq.mpi.num_ranks(), localData)
+    assert isinstance(gatherData, np.ndarray)
+    assert len(gatherData) == cudaq.mpi.num_ranks()
+    assert np.allclose(gatherData,
+                       np.arange(cudaq.mpi.num_ranks(), dtype=np.float64),
+                       rtol=0.,
+                       atol=1e-12)
 
     # Broadcast
     ref_data = [1.0, 2.0, 3.0]
@@ -94,7 +94,7 @@ std::ostream &operator<<(std::ostream &os, future &f) {
   j["jobs"] = f.jobs;
   j["qpu"] = f.qpuName;
   j["config"] = f.serverConfig;
-  os << j.dump(4);
+  os << j.dump();
   return os;
 }
 
@@ -60,26 +60,38 @@ std::complex<double> state::operator()(std::size_t idx, std::size_t jdx) {
 double state::overlap(state &other) {
   double sum = 0.0;
   auto &[shape, stateData] = _data;
+  auto &otherData = std::get<1>(other._data);
   if (shape.size() != std::get<0>(other._data).size())
     throw std::runtime_error(
         "Cannot compare state vectors and density matrices.");
 
   if (shape.size() == 1) {
-    for (std::size_t i = 0; i < std::get<1>(_data).size(); i++) {
-      sum += std::abs(std::get<1>(_data)[i] * other[i]);
+    // Nothing to sum for an empty state, and log2(0) is not a qubit count.
+    if (stateData.empty())
+      return sum;
+
+    // Same as summing against other[i], but without recomputing the qubit
+    // count for every element.
+    std::size_t numQubits = std::log2(otherData.size());
+    for (std::size_t i = 0; i < stateData.size(); i++) {
+      std::size_t otherIdx = 0;
+      for (std::size_t j = 0; j < numQubits; ++j)
+        if (i & (1ULL << j))
+          otherIdx |= (1ULL << ((numQubits - 1) - j));
+      sum += std::abs(stateData[i] * otherData[otherIdx]);
     }
   } else {
 
-    // Create rho and sigma matrices
-    Eigen::MatrixXcd rho =
-        Eigen::Map<Eigen::MatrixXcd>(stateData.data(), shape[0], shape[1]);
-    Eigen::MatrixXcd sigma = Eigen::Map<Eigen::MatrixXcd>(
-        std::get<1>(other._data).data(), shape[0], shape[1]);
+    // View the rho and sigma matrices in place, no need to copy them.
+    Eigen::Map<Eigen::MatrixXcd> rho(stateData.data(), shape[0], shape[1]);
+    Eigen::Map<Eigen::MatrixXcd> sigma(otherData.data(), shape[0], shape[1]);
 
     // For qubit systems, F(rho,sigma) = tr(rho*sigma) + 2 *
-    // sqrt(det(rho)*det(sigma))
+    // sqrt(det(rho)*det(sigma)). The trace only needs the diagonal of the
+    // product, sum_ij rho_ij * sigma_ji, so skip the full matrix product.
     auto detprod = rho.determinant() * sigma.determinant();
-    sum = (rho * sigma).trace().real() + 2 * std::sqrt(detprod.real());
+    auto trace = rho.transpose().cwiseProduct(sigma).sum();
+    sum = trace.real() + 2 * std::sqrt(detprod.real());
   }
 
   // return the overlap
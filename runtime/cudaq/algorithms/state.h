@@ -29,7 +29,7 @@ private:
 
 public:
   /// @brief The constructor, takes the simulation data
-  state(State d) : _data(d) {}
+  state(State d) : _data(std::move(d)) {}
 
   /// @brief  Default constructor (empty state)
   state() : _data({0}, {}){};
@@ -86,7 +86,7 @@ state extractState(KernelFunctor &&kernel) {
   platform.reset_exec_ctx();
 
   // Return the state data.
-  return state(context.simulationData);
+  return state(std::move(context.simulationData));
 }
 
 template <typename KernelFunctor>
@@ -115,7 +115,7 @@ auto runGetStateAsync(KernelFunctor &&wrappedKernel,
         func();
         platform.reset_exec_ctx(qpu_id);
         // Extract state data
-        p.set_value(state(context.simulationData));
+        p.set_value(state(std::move(context.simulationData)));
       });
 
   platform.enqueueAsyncTask(qpu_id, wrapped);
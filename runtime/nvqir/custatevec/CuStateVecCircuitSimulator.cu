@@ -643,21 +643,25 @@ public:
     if (stateDimension == 0)
       return cudaq::State{{stateDimension}, {}};
 
-    std::vector<std::complex<ScalarType>> tmp(stateDimension);
-    HANDLE_CUDA_ERROR(cudaMemcpy(tmp.data(), deviceStateVector,
-               stateDimension * sizeof(std::complex<ScalarType>),
-               cudaMemcpyDeviceToHost));
-
     if constexpr (std::is_same_v<ScalarType, float>) {
-      std::vector<std::complex<double>> data;
-      std::transform(tmp.begin(), tmp.end(), std::back_inserter(data),
-                     [](std::complex<float> &el) -> std::complex<double> {
-                       return {static_cast<double>(el.real()),
-                               static_cast<double>(el.imag())};
+      std::vector<std::complex<float>> tmp(stateDimension);
+      HANDLE_CUDA_ERROR(cudaMemcpy(tmp.data(), deviceStateVector,
+                                   stateDimension * sizeof(std::complex<float>),
+                                   cudaMemcpyDeviceToHost));
+
+      std::vector<std::complex<double>> data(stateDimension);
+      std::transform(tmp.begin(), tmp.end(), data.begin(),
+                     [](const std::complex<float> &el) {
+                       return std::complex<double>(el);
                      });
-      return cudaq::State{{stateDimension}, data};
+      return cudaq::State{{stateDimension}, std::move(data)};
     } else {
-      return cudaq::State{{stateDimension}, tmp};
+      std::vector<std::complex<double>> data(stateDimension);
+      HANDLE_CUDA_ERROR(
+          cudaMemcpy(data.data(), deviceStateVector,
+                     stateDimension * sizeof(std::complex<double>),
+                     cudaMemcpyDeviceToHost));
+      return cudaq::State{{stateDimension}, std::move(data)};
     }
   }
 
@@ -243,10 +243,14 @@ SimulatorTensorNetBase::observe(const cudaq::spin_op &ham) {
                                  cudaq::sample_result(cudaq::ExecutionResult(
                                      {}, ham.to_string(false), expVal.real())));
   } else {
-    TensorNetworkSpinOp spinOp(ham, m_cutnHandle);
+    auto hamData = ham.get_raw_data();
+    if (!m_spinOpCache || hamData != m_spinOpCacheData) {
+      m_spinOpCache = std::make_unique<TensorNetworkSpinOp>(ham, m_cutnHandle);
+      m_spinOpCacheData = std::move(hamData);
+    }
     std::complex<double> expVal =
-        m_state->computeExpVal(spinOp.getNetworkOperator());
-    expVal += spinOp.getIdentityTermOffset();
+        m_state->computeExpVal(m_spinOpCache->getNetworkOperator());
+    expVal += m_spinOpCache->getIdentityTermOffset();
     return cudaq::observe_result(expVal.real(), ham,
                                  cudaq::sample_result(cudaq::ExecutionResult(
                                      {}, ham.to_string(false), expVal.real())));
@@ -319,6 +323,7 @@ void SimulatorTensorNetBase::swap(const std::vector<std::size_t> &ctrlBits,
 
 SimulatorTensorNetBase::~SimulatorTensorNetBase() {
   m_state.reset();
+  m_spinOpCache.reset();
   for (const auto &[key, dMem] : m_gateDeviceMemCache)
     HANDLE_CUDA_ERROR(cudaFree(dMem));
 
@@ -10,6 +10,7 @@
 
 #include "CircuitSimulator.h"
 #include "cutensornet.h"
+#include "tensornet_spin_op.h"
 #include "tensornet_state.h"
 
 namespace nvqir {
@@ -89,6 +90,13 @@ protected:
   cutensornetHandle_t m_cutnHandle;
   std::unique_ptr<TensorNetState> m_state;
   std::unordered_map<std::string, void *> m_gateDeviceMemCache;
+  // Network operator of the most recently observed `spin_op`, along with the
+  // raw data it was built from, so that repeated `observe` calls (e.g., in a
+  // variational loop) don't rebuild it.
+  std::unique_ptr<TensorNetworkSpinOp> m_spinOpCache;
+  std::pair<std::vector<cudaq::spin_op::spin_op_term>,
+            std::vector<std::complex<double>>>
+      m_spinOpCacheData;
 };
 
 } // end namespace nvqir